@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+from agents.pattern_analyzer.schemas.pattern_analyzer_schema import (
+    ArticleAnalysis,
+    Claim,
+    PatternAnalysisResult,
+)
+from memory.pattern_analysis_store import PatternAnalysisMemory
+from memory.store_utils import load_json_file
+
+
+def _read_store(path: str) -> Dict[str, Any]:
+    # Parsed fresh rather than through read_json_store: _load caches the
+    # built model, so the raw dict would only be held twice.
+    return load_json_file(path)
+
+
+def _trust_local_store() -> bool:
+    return os.getenv("TRUTHLENS_TRUST_LOCAL_STORE", "1") == "1"
+
+
+def _construct_trusted(data: Dict[str, Any]) -> PatternAnalysisResult:
+    """
+    Build the model tree without validation.
+
+    The store is written by PatternAnalysisMemory from an already validated
+    PatternAnalysisResult, so re-validating every nested article and claim
+    on load is redundant.
+    """
+    articles = [
+        ArticleAnalysis.model_construct(
+            **{
+                **art,
+                "key_claims": [Claim.model_construct(**c) for c in art.get("key_claims", [])],
+            }
+        )
+        for art in data.get("analyzed_articles", [])
+    ]
+    return PatternAnalysisResult.model_construct(
+        statement=data["statement"],
+        analyzed_articles=articles,
+    )
+
+
+@lru_cache(maxsize=1)
+def _load(path: str, mtime_ns: int) -> PatternAnalysisResult:
+    """
+    Read and validate the latest PatternAnalysisResult stored at `path`.
+
+    `mtime_ns` is only part of the cache key: a new Pattern Analyzer run
+    rewrites the store, bumps its mtime and so invalidates the cached result.
+    """
+    store = _read_store(path)
+
+    if not store:
+        raise ValueError(
+            "No Pattern Analysis data found in local memory. "
+            "Run the Pattern Analyzer agent first."
+        )
+
+    # Assuming insertion order is preserved, take the last key
+    last_key = next(reversed(store))
+    data = store[last_key]
+    if _trust_local_store():
+        return _construct_trusted(data)
+    return PatternAnalysisResult.model_validate(data)
+
+
+def get_latest() -> PatternAnalysisResult:
+    """
+    Load the latest PatternAnalysisResult from local PatternAnalysisMemory.
+
+    Shared by critic_tool and implication_chains so that one Critic run reads
+    and validates the store once. The returned object is shared between
+    callers and must not be mutated.
+
+    Set TRUTHLENS_TRUST_LOCAL_STORE=0 to validate the stored data instead of
+    trusting it (e.g. after editing the store by hand).
+    """
+    memory = PatternAnalysisMemory()
+    path = str(memory.path)
+    return _load(path, os.stat(path).st_mtime_ns)
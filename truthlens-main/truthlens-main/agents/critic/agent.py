@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict
 
 from google.adk.agents import Agent
@@ -6,22 +7,29 @@ from agents.critic.schemas.critic_schema import CriticResult
 from agents.critic.tools import critic_input_tool, build_implication_chains_tool
 
 
-def critic_tool_wrapper() -> Dict[str, Any]:
+async def critic_tool_wrapper() -> Dict[str, Any]:
     """
     ADK tool wrapper for critic_input_tool.
 
     Returns the data Critic needs to analyze the Pattern Analysis result.
+
+    Declared async so ADK can run it concurrently with
+    implication_chains_tool_wrapper when both are requested in the same turn;
+    the blocking body runs in the default executor.
     """
-    return critic_input_tool()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, critic_input_tool)
 
 
-def implication_chains_tool_wrapper() -> Dict[str, Any]:
+async def implication_chains_tool_wrapper() -> Dict[str, Any]:
     """
     ADK tool wrapper for build_implication_chains_tool.
 
     Computes initial implication chains per article using keyword-based heuristics.
+    The Gemini call and store read run in the default executor.
     """
-    return build_implication_chains_tool()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, build_implication_chains_tool)
 
 
 CRITIC_SYSTEM_PROMPT = """
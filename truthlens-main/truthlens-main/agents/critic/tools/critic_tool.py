@@ -2,21 +2,21 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from agents.critic.schemas.critic_schema import CriticResult, ImplicationChain
+from agents.critic import _pa_cache
+from agents.critic.schemas.critic_schema import CriticResult
 from agents.critic.tools.implication_chains import build_implication_chains_tool
-from agents.pattern_analyzer.schemas.pattern_analyzer_schema import (
-    ArticleAnalysis,
-    PatternAnalysisResult,
-)
+from agents.pattern_analyzer.schemas.pattern_analyzer_schema import PatternAnalysisResult
 from memory.critic_store import CriticMemory
 from memory.pattern_analysis_store import PatternAnalysisMemory
+from memory.session_store import save_critic_result_session
 
 
-def _load_latest_pattern_analysis() -> PatternAnalysisResult:
+def _load_latest_pattern_analysis_raw() -> Dict[str, Any]:
     """
-    Load the latest PatternAnalysisResult from local PatternAnalysisMemory.
+    Load the latest Pattern Analysis entry as the plain dict held in the store.
 
-    Assumes Pattern Analyzer has run recently and cleared old entries.
+    Used by passthrough tools that only re-emit the data as JSON, so there is
+    no point in building (and then dumping) PatternAnalysisResult models.
     """
     memory = PatternAnalysisMemory()
     store = memory._read_store()  # type: ignore[attr-defined]
@@ -27,10 +27,8 @@ def _load_latest_pattern_analysis() -> PatternAnalysisResult:
             "Run the Pattern Analyzer agent first."
         )
 
-    # Assuming insertion order is preserved, take the last key
     last_key = next(reversed(store))
-    data = store[last_key]
-    return PatternAnalysisResult(**data)
+    return store[last_key]
 
 
 def critic_input_tool() -> Dict[str, Any]:
@@ -40,18 +38,16 @@ def critic_input_tool() -> Dict[str, Any]:
 
     You can keep this for debugging or remove it once everything uses run_critic().
     """
-    pa: PatternAnalysisResult = _load_latest_pattern_analysis()
+    pa: Dict[str, Any] = _load_latest_pattern_analysis_raw()
+    articles: List[Dict[str, Any]] = pa.get("analyzed_articles", [])
 
-    def _sort_key(a: ArticleAnalysis) -> str:
-        return a.publish_date or ""
+    sorted_articles = sorted(articles, key=lambda a: a.get("publish_date") or "")
 
-    sorted_articles: List[ArticleAnalysis] = sorted(pa.analyzed_articles, key=_sort_key)
-
-    allowed_urls = [a.url for a in pa.analyzed_articles]
+    allowed_urls = [a.get("url") for a in articles]
 
     return {
-        "pattern_analysis": pa.model_dump(),
-        "articles_sorted_by_date": [a.model_dump() for a in sorted_articles],
+        "pattern_analysis": pa,
+        "articles_sorted_by_date": sorted_articles,
         "allowed_urls": allowed_urls,
     }
 
@@ -72,23 +68,21 @@ def run_critic() -> CriticResult:
     narrative phases, gaps) here later.
     """
     # 1) Load latest PatternAnalysisResult
-    pa: PatternAnalysisResult = _load_latest_pattern_analysis()
+    pa: PatternAnalysisResult = _pa_cache.get_latest()
 
     # 2) Build implication chains using the existing tool.
     #    This returns a dict:
     #      { "statement": "...", "implication_chains": [ {...}, ... ] }
     chains_payload: Dict[str, Any] = build_implication_chains_tool()
 
-    raw_chains = chains_payload.get("implication_chains", [])
-    implication_chains: List[ImplicationChain] = [
-        ImplicationChain(**c) for c in raw_chains
-    ]
+    # Chains arrive as plain dicts; CriticResult validates them once below.
+    raw_chains: List[Dict[str, Any]] = chains_payload.get("implication_chains", [])
 
     # 3) Build a minimal high_level_summary.
     #    For now we keep this simple; later you can:
     #      - call a small LLM helper, or
     #      - compute a more descriptive summary from chains + pattern_analysis.
-    if implication_chains:
+    if raw_chains:
         high_level_summary = (
             "This analysis identifies one or more chains of implications between claims "
             "found in the analyzed articles and evaluates how well each step is supported "
@@ -105,15 +99,19 @@ def run_critic() -> CriticResult:
     result = CriticResult(
         statement=pa.statement,
         high_level_summary=high_level_summary,
-        implication_chains=implication_chains,
+        implication_chains=raw_chains,
         claim_consensus=[],
         narrative_phases=[],
         gaps_and_caveats=[],
     )
 
-    # 5) Persist CriticResult in local CriticMemory (latest only).
+    # 5) Persist CriticResult in local CriticMemory (latest only) and in the
+    #    session store, so downstream agents in this process skip the disk.
+    #    Dump once and share the dict between both persistence layers.
+    result_dict = result.model_dump()
     critic_memory = CriticMemory()
-    critic_memory.save_result(result)
+    critic_memory.save_result_dict(result.statement, result_dict)
+    save_critic_result_session(result_dict)
 
     return result
 
@@ -1,72 +1,183 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import re
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import google.generativeai as genai
 
-from agents.critic.schemas.critic_schema import (
-    ImplicationChain,
-    ImplicationStep,
-)
+from agents.critic import _pa_cache
 from agents.pattern_analyzer.schemas.pattern_analyzer_schema import (
     ArticleAnalysis,
-    Claim,
     PatternAnalysisResult,
 )
-from memory.pattern_analysis_store import PatternAnalysisMemory
 
 
-# --- Helpers to load Pattern Analysis ----------------------------------------
+logger = logging.getLogger("truthlens.critic.implication_chains")
+
+
+# Per article: one (normalized word set, classified modality) pair per key claim.
+ClaimIndex = List[List[Tuple[FrozenSet[str], Optional[str]]]]
+
+# Word -> (article index, claim index) positions of every key claim containing it.
+ClaimPostings = Dict[str, List[Tuple[int, int]]]
 
+_MODALITIES = ("affirmation", "denial", "speculation")
+
+
+# --- LLM candidate generation (Gemini 2.5 Flash) -----------------------------
 
-def _load_latest_pattern_analysis() -> PatternAnalysisResult:
+
+_MODEL: Optional[genai.GenerativeModel] = None
+_MODEL_LOCK = threading.Lock()
+
+# Have Gemini emit schema-conforming JSON directly instead of free text.
+_CANDIDATE_GENERATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema={
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "premise": {"type": "string"},
+                "consequence": {"type": "string"},
+                "reasoning": {"type": "string"},
+            },
+            "required": ["premise", "consequence"],
+        },
+    },
+)
+
+
+def _get_model() -> Optional[genai.GenerativeModel]:
     """
-    Load the latest PatternAnalysisResult from local PatternAnalysisMemory.
+    Configure genai and build the Gemini model once per process.
+
+    Returns None (and retries on the next call) while GOOGLE_API_KEY is unset.
     """
-    memory = PatternAnalysisMemory()
-    store = memory._read_store()  # type: ignore[attr-defined]
+    global _MODEL
+    if _MODEL is not None:
+        return _MODEL
+    with _MODEL_LOCK:
+        if _MODEL is None:
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                return None
+            genai.configure(api_key=api_key)
+            _MODEL = genai.GenerativeModel("gemini-2.5-flash")
+    return _MODEL
+
+
+# Upper bound on concurrent Gemini requests for a batch of statements.
+_MAX_CONCURRENT_LLM_CALLS = 8
+
+# On-disk cache of LLM candidates, keyed by the prompt inputs.
+_CANDIDATE_CACHE_DIR = Path(
+    os.getenv("TRUTHLENS_IMPLICATION_CACHE_DIR", "./memory/implication_llm_cache")
+)
 
-    if not store:
-        raise ValueError(
-            "No Pattern Analysis data found in local memory. "
-            "Run the Pattern Analyzer agent first."
-        )
 
-    last_key = next(reversed(store))
-    data = store[last_key]
-    return PatternAnalysisResult(**data)
+def _candidate_cache_path(statement: str, summaries: List[str]) -> Path:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in [statement.strip(), *sorted(summaries)]:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return _CANDIDATE_CACHE_DIR / f"{digest.hexdigest()}.json"
 
 
-# --- LLM candidate generation (Gemini 2.5 Flash) -----------------------------
+def _read_cached_candidates(path: Path) -> Optional[List[Dict[str, str]]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, list) else None
+
+
+def _write_cached_candidates(path: Path, candidates: List[Dict[str, str]]) -> None:
+    """
+    Write-through after a successful LLM call. Written to a temp file and
+    renamed so concurrent readers never see a partial entry.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(candidates, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Could not write candidate cache %s: %s", path, e)
+
+
+def _generate_implication_candidates_batch(
+    pas: List[PatternAnalysisResult],
+) -> List[List[Dict[str, str]]]:
+    """
+    Propose implication candidates for several PatternAnalysisResults.
+
+    The requests are independent, so they are issued concurrently and the
+    results are returned in input order. A batch of one runs inline.
+    """
+    if len(pas) <= 1:
+        return [_request_implication_candidates(pa) for pa in pas]
+
+    workers = min(_MAX_CONCURRENT_LLM_CALLS, len(pas))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_request_implication_candidates, pas))
 
 
 def _generate_implication_candidates(pa: PatternAnalysisResult) -> List[Dict[str, str]]:
+    """
+    Single-statement entry point: a batch of size one.
+    """
+    return _generate_implication_candidates_batch([pa])[0]
+
+
+def _compact_summaries(pa: PatternAnalysisResult) -> List[str]:
+    """
+    Narrative summaries to put in the prompt, with whitespace collapsed and
+    verbatim duplicates (common with syndicated wire copy) dropped, keeping
+    first-seen order.
+    """
+    compacted = (
+        " ".join(art.narrative_summary.split())
+        for art in pa.analyzed_articles
+        if art.narrative_summary
+    )
+    return [s for s in dict.fromkeys(compacted) if s]
+
+
+def _request_implication_candidates(pa: PatternAnalysisResult) -> List[Dict[str, str]]:
     """
     Use Gemini 2.5 Flash to propose candidate implication pairs (premise, consequence)
     based on article narrative summaries.
 
     Returns a list of dicts with keys: "premise", "consequence", "reasoning".
     """
-    summaries = [
-        art.narrative_summary
-        for art in pa.analyzed_articles
-        if art.narrative_summary
-    ]
+    summaries = _compact_summaries(pa)
     if not summaries:
         return []
 
+    cache_path = _candidate_cache_path(pa.statement, summaries)
+    cached = _read_cached_candidates(cache_path)
+    if cached is not None:
+        return cached
+
     summaries_text = "\n".join(f"- {s}" for s in summaries)
 
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        print("[ImplicationChains] WARNING: GOOGLE_API_KEY not set. Returning no candidates.")
+    model = _get_model()
+    if model is None:
+        logger.warning("GOOGLE_API_KEY not set. Returning no candidates.")
         return []
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-2.5-flash")
-
     prompt = f"""
 You are helping to analyze logical implications in news coverage about this statement:
 
@@ -92,17 +203,12 @@ Summaries:
 """.strip()
 
     try:
-        response = model.generate_content(prompt)
-        text = (response.text or "").strip()
-
-        # Try to clean common markdown fences if the model adds them
-        if text.startswith("```"):
-            # strip first and last fence
-            text = text.strip("`")
-            # crude but helps in many cases
-        candidates = json.loads(text)
+        response = model.generate_content(
+            prompt, generation_config=_CANDIDATE_GENERATION_CONFIG
+        )
+        candidates = json.loads(response.text or "[]")
         if not isinstance(candidates, list):
-            print("[ImplicationChains] LLM returned non-list JSON; ignoring.")
+            logger.warning("LLM returned non-list JSON; ignoring.")
             return []
         # Keep only objects with required keys
         clean: List[Dict[str, str]] = []
@@ -116,74 +222,225 @@ Summaries:
                 clean.append(
                     {"premise": prem, "consequence": cons, "reasoning": reas}
                 )
+        if clean:
+            _write_cached_candidates(cache_path, clean)
         return clean
     except Exception as e:
-        print(f"[ImplicationChains] Error generating candidates: {e}")
+        logger.warning("Error generating candidates: %s", e)
         return []
 
 
 # --- Verification over key_claims -------------------------------------------
 
 
+# A token is any run of characters other than whitespace, commas and periods.
+_TOKEN_RE = re.compile(r"[^\s,.]+")
+
+
 def _normalize_text(t: str) -> List[str]:
-    return [w for w in t.lower().replace(",", " ").replace(".", " ").split() if w]
+    return _TOKEN_RE.findall(t.lower())
 
 
-def _jaccard_similarity(a_words: List[str], b_words: List[str]) -> float:
-    if not a_words or not b_words:
-        return 0.0
-    sa, sb = set(a_words), set(b_words)
-    inter = len(sa & sb)
-    if inter == 0:
-        return 0.0
-    return inter / float(len(sa))
+_DENIAL_WORDS = frozenset({"denies", "denied", "refutes", "refuted", "false"})
+_AFFIRMATION_WORDS = frozenset({"reports", "reported", "claims", "claimed", "alleges", "stated"})
+_SPECULATION_WORDS = frozenset({"alleged", "allegedly", "suggests", "may", "might", "possibly"})
 
 
+@lru_cache(maxsize=512)
 def _classify_modality(modality: Optional[str]) -> Optional[str]:
     """
     Map free-text modality into one of: 'affirmation', 'denial', 'speculation'.
     Very crude first version; refine as needed.
+
+    Keywords are matched as whole words, so e.g. "mayor" no longer counts
+    as "may".
     """
     if not modality:
         return None
 
-    m = modality.lower()
-    if any(k in m for k in ["denies", "denied", "refutes", "refuted", "false"]):
+    words = frozenset(_normalize_text(modality))
+    if words & _DENIAL_WORDS:
         return "denial"
-    if any(k in m for k in ["reports", "reported", "claims", "claimed", "alleges", "stated"]):
+    if words & _AFFIRMATION_WORDS:
         return "affirmation"
-    if any(k in m for k in ["alleged", "allegedly", "suggests", "may", "might", "possibly"]):
+    if words & _SPECULATION_WORDS:
         return "speculation"
     # Default: treat unknown as speculation rather than hard affirmation/denial
     return "speculation"
 
 
+def _build_claim_index(articles: List[ArticleAnalysis]) -> ClaimIndex:
+    """
+    Tokenize and classify every key claim once, so candidate verification
+    does not redo it for each (candidate, article) pair.
+    """
+    return [
+        [
+            (frozenset(_normalize_text(claim.text)), _classify_modality(claim.modality))
+            for claim in art.key_claims
+        ]
+        for art in articles
+    ]
+
+
+def _build_claim_postings(claim_index: ClaimIndex) -> ClaimPostings:
+    """
+    Invert the claim index so that a target text only touches the claims it
+    shares at least one word with.
+    """
+    postings: ClaimPostings = defaultdict(list)
+    for a_idx, claims in enumerate(claim_index):
+        for c_idx, (claim_words, _) in enumerate(claims):
+            for word in claim_words:
+                postings[word].append((a_idx, c_idx))
+    return postings
+
+
 def _check_claim_support(
-    key_claims: List[Claim],
-    target_text: str,
+    claim_index: ClaimIndex,
+    postings: ClaimPostings,
+    target_words: FrozenSet[str],
     similarity_threshold: float = 0.3,
-) -> Optional[str]:
+) -> List[Optional[str]]:
     """
-    Fuzzy match target_text against a list of key claims.
-    Returns classified modality ('affirmation', 'denial', 'speculation') or None.
+    Fuzzy match target_words against the key claims of every article at once.
+
+    Similarity is the share of target words found in a claim. Overlap counts
+    are accumulated from the postings in a single pass instead of
+    intersecting word sets claim by claim.
+
+    Returns one classified modality ('affirmation', 'denial', 'speculation')
+    or None per article, in article order.
     """
-    target_words = _normalize_text(target_text)
+    modalities: List[Optional[str]] = [None] * len(claim_index)
     if not target_words:
-        return None
+        return modalities
+
+    overlap: Dict[Tuple[int, int], int] = defaultdict(int)
+    for word in target_words:
+        for pos in postings.get(word, ()):
+            overlap[pos] += 1
+
+    target_size = float(len(target_words))
+    best: Dict[int, Tuple[float, int]] = {}
+
+    for (a_idx, c_idx), inter in overlap.items():
+        classified = claim_index[a_idx][c_idx][1]
+        sim = inter / target_size
+        if sim < similarity_threshold or not classified:
+            continue
+        prev = best.get(a_idx)
+        # Ties go to the earliest claim, as in a claim-by-claim scan.
+        if prev is None or sim > prev[0] or (sim == prev[0] and c_idx < prev[1]):
+            best[a_idx] = (sim, c_idx)
+            modalities[a_idx] = classified
+
+    return modalities
+
+
+def _match_texts(
+    texts: Set[str],
+    claim_index: ClaimIndex,
+    postings: ClaimPostings,
+) -> Dict[str, List[Optional[str]]]:
+    """
+    Per-article modalities for each distinct premise/consequence text.
+
+    Candidates often share a premise or consequence, so matching is done
+    once per unique text rather than once per candidate.
+    """
+    return {
+        text: _check_claim_support(claim_index, postings, frozenset(_normalize_text(text)))
+        for text in texts
+    }
+
+
+def _verify_candidate(
+    idx: int,
+    cand: Dict[str, str],
+    mod_map: Dict[str, List[Optional[str]]],
+    source_labels: List[str],
+) -> Dict[str, Any]:
+    """
+    Verify one LLM candidate (premise -> consequence) against the key claims
+    of all articles and turn it into a one-step chain.
+
+    The chain is returned as a plain dict shaped like ImplicationChain; it is
+    validated once, when the caller builds the CriticResult.
+    """
+    premise_text = cand["premise"]
+    conseq_text = cand["consequence"]
+    reasoning = cand.get("reasoning", "")
+
+    premise_mods = mod_map[premise_text]
+    conseq_mods = mod_map[conseq_text]
+
+    premise_counts = Counter(premise_mods)
+    conseq_counts = Counter(conseq_mods)
+    premise_votes = {m: premise_counts[m] for m in _MODALITIES}
+    conseq_votes = {m: conseq_counts[m] for m in _MODALITIES}
+
+    # supported if this article affirms A AND (affirms B or speculates on B)
+    supporting_sources: List[str] = [
+        label
+        for label, p_mod, c_mod in zip(source_labels, premise_mods, conseq_mods)
+        if p_mod == "affirmation" and c_mod in ("affirmation", "speculation")
+    ]
+
+    # refuted if this article affirms A but denies B
+    refuting_sources: List[str] = [
+        label
+        for label, p_mod, c_mod in zip(source_labels, premise_mods, conseq_mods)
+        if p_mod == "affirmation" and c_mod == "denial"
+    ]
+
+    # Decide chain-level verdict for this A -> B
+    if len(supporting_sources) > 1 and not refuting_sources:
+        overall = "consistent"
+        step_assessment = (
+            "well supported by multiple sources with no clear refutations"
+        )
+    elif len(supporting_sources) == 1 and not refuting_sources:
+        overall = "partially supported"
+        step_assessment = "weakly supported (single-source implication)"
+    elif refuting_sources:
+        overall = "contradicted"
+        step_assessment = (
+            "contested: at least one source affirms the premise but denies the consequence"
+        )
+    else:
+        # Check if the premise itself is mostly denied
+        if premise_votes["denial"] > premise_votes["affirmation"]:
+            overall = "contradicted"
+            step_assessment = (
+                "premise itself appears more often denied than affirmed"
+            )
+        else:
+            overall = "speculative"
+            step_assessment = (
+                "inferred only by LLM, with no strong article-level corroboration"
+            )
 
-    best_sim = 0.0
-    best_modality: Optional[str] = None
+    step = {
+        "premise": premise_text,
+        "conclusion": conseq_text,
+        "supporting_sources": supporting_sources,
+        "refuting_sources": refuting_sources,
+        "assessment": step_assessment,
+    }
 
-    for claim in key_claims:
-        claim_words = _normalize_text(claim.text)
-        sim = _jaccard_similarity(target_words, claim_words)
-        if sim >= similarity_threshold and sim > best_sim:
-            classified = _classify_modality(claim.modality)
-            if classified:
-                best_sim = sim
-                best_modality = classified
+    chain_description = f"Implication chain {idx}: {premise_text} -> {conseq_text}"
+    notes = (
+        f"LLM reasoning: {reasoning}. "
+        f"Premise votes: {premise_votes}. Consequence votes: {conseq_votes}."
+    )
 
-    return best_modality
+    return {
+        "description": chain_description,
+        "steps": [step],
+        "overall_assessment": overall,
+        "notes": notes,
+    }
 
 
 # --- Public tool: build implication chains ----------------------------------
@@ -205,99 +462,31 @@ def build_implication_chains_tool() -> Dict[str, Any]:
         "implication_chains": [ ImplicationChain-as-dict, ... ]
       }
     """
-    pa: PatternAnalysisResult = _load_latest_pattern_analysis()
+    pa: PatternAnalysisResult = _pa_cache.get_latest()
     articles: List[ArticleAnalysis] = pa.analyzed_articles
 
     # Phase 1: LLM candidate generation
     candidates = _generate_implication_candidates(pa)
     if not candidates:
-        print("[ImplicationChains] No candidates generated by LLM.")
+        logger.debug("No candidates generated by LLM.")
         return {"statement": pa.statement, "implication_chains": []}
 
-    implication_chains: List[ImplicationChain] = []
-
-    for idx, cand in enumerate(candidates, start=1):
-        premise_text = cand["premise"]
-        conseq_text = cand["consequence"]
-        reasoning = cand.get("reasoning", "")
-
-        premise_votes = {"affirmation": 0, "denial": 0, "speculation": 0}
-        conseq_votes = {"affirmation": 0, "denial": 0, "speculation": 0}
-
-        supporting_sources: List[str] = []
-        refuting_sources: List[str] = []
+    article_claim_index = _build_claim_index(articles)
+    claim_postings = _build_claim_postings(article_claim_index)
 
-        # Phase 2: Loop through articles to check support/refutation
-        for art in articles:
-            p_mod = _check_claim_support(art.key_claims, premise_text)
-            c_mod = _check_claim_support(art.key_claims, conseq_text)
+    # Use URL as canonical source id (or fallback to source_name)
+    source_labels = [art.url or (art.source_name or "unknown_source") for art in articles]
 
-            if p_mod:
-                premise_votes[p_mod] += 1
-            if c_mod:
-                conseq_votes[c_mod] += 1
+    # Phase 2: Check support/refutation across all articles, per candidate
+    unique_texts = {c["premise"] for c in candidates} | {c["consequence"] for c in candidates}
+    mod_map = _match_texts(unique_texts, article_claim_index, claim_postings)
 
-            # Use URL as canonical source id (or fallback to source_name)
-            src_label = art.url or (art.source_name or "unknown_source")
-
-            # supported if this article affirms A AND (affirms B or speculates on B)
-            if p_mod == "affirmation" and c_mod in ("affirmation", "speculation"):
-                supporting_sources.append(src_label)
-
-            # refuted if this article affirms A but denies B
-            if p_mod == "affirmation" and c_mod == "denial":
-                refuting_sources.append(src_label)
-
-        # Decide chain-level verdict for this A -> B
-        if len(supporting_sources) > 1 and not refuting_sources:
-            overall = "consistent"
-            step_assessment = (
-                "well supported by multiple sources with no clear refutations"
-            )
-        elif len(supporting_sources) == 1 and not refuting_sources:
-            overall = "partially supported"
-            step_assessment = "weakly supported (single-source implication)"
-        elif refuting_sources:
-            overall = "contradicted"
-            step_assessment = (
-                "contested: at least one source affirms the premise but denies the consequence"
-            )
-        else:
-            # Check if the premise itself is mostly denied
-            if premise_votes["denial"] > premise_votes["affirmation"]:
-                overall = "contradicted"
-                step_assessment = (
-                    "premise itself appears more often denied than affirmed"
-                )
-            else:
-                overall = "speculative"
-                step_assessment = (
-                    "inferred only by LLM, with no strong article-level corroboration"
-                )
-
-        step = ImplicationStep(
-            premise=premise_text,
-            conclusion=conseq_text,
-            supporting_sources=supporting_sources,
-            refuting_sources=refuting_sources,
-            assessment=step_assessment,
-        )
-
-        chain_description = f"Implication chain {idx}: {premise_text} -> {conseq_text}"
-        notes = (
-            f"LLM reasoning: {reasoning}. "
-            f"Premise votes: {premise_votes}. Consequence votes: {conseq_votes}."
-        )
-
-        chain = ImplicationChain(
-            description=chain_description,
-            steps=[step],
-            overall_assessment=overall,
-            notes=notes,
-        )
-        implication_chains.append(chain)
+    implication_chains: List[Dict[str, Any]] = [
+        _verify_candidate(idx, cand, mod_map, source_labels)
+        for idx, cand in enumerate(candidates, start=1)
+    ]
 
     return {
         "statement": pa.statement,
-        "implication_chains": [c.model_dump() for c in implication_chains],
+        "implication_chains": implication_chains,
     }
\ No newline at end of file
@@ -1,11 +1,21 @@
+import hashlib
 import os
-from typing import List, Dict, Any
-
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Tuple
+
+import orjson
 import requests
 from dotenv import load_dotenv
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from agents.fact_finder.schemas.fact_finder_schema import SourceInfo, FactFinderResult
+from agents.fact_finder.tools.url_utils import canonical_url
 from memory.local_store import LocalFactFinderMemory
 from memory.session_store import save_fact_finder_result_session
 
@@ -14,11 +24,82 @@ load_dotenv()
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
 FIRECRAWL_SEARCH_URL = "https://api.firecrawl.dev/v2/search"
 
+_SOURCE_LIST_ADAPTER = TypeAdapter(List[SourceInfo])
+
+# Short-lived in-process cache of search responses, so re-running the same
+# statement within a few minutes doesn't hit Firecrawl again.
+SEARCH_CACHE_TTL_SECONDS = 300
+SEARCH_CACHE_MAXSIZE = 256
+_SEARCH_CACHE: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
 
 class FirecrawlError(Exception):
     """Custom exception for Firecrawl-related errors."""
 
 
+def _build_session() -> requests.Session:
+    """
+    Shared keep-alive session for Firecrawl, so repeated calls reuse pooled
+    TLS connections and transient 429/5xx responses are retried.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    session.headers["Content-Type"] = "application/json"
+    if FIRECRAWL_API_KEY:
+        session.headers["Authorization"] = f"Bearer {FIRECRAWL_API_KEY}"
+    return session
+
+
+_SESSION = _build_session()
+
+
+# Search-time scrape options are the same for every call, so build them once.
+SEARCH_SCRAPE_OPTIONS: Dict[str, Any] = {
+    "formats": [
+        {
+            "type": "json",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "url": {"type": "string"},
+                    "description": {"type": "string"},
+                    "source_name": {"type": "string"},
+                    "source_type": {"type": "string"},
+                    "source_class": {"type": "string"},
+                    "source_country": {"type": "string"},
+                    "historical_verdicts": {"type": "string"},
+                    "publish_date": {"type": "string", "format": "date"},
+                },
+                "required": ["url"],
+            },
+            "prompt": (
+                "Extract the following fields for this result: "
+                "title of the article, direct URL, a brief description, "
+                "the name of the publication (source_name), the country of the publication (source_country), "
+                "any historical verdicts related to the statements (historical_verdicts), "
+                "the type of publication source class (state_media/mainstream/partisan/unknown), and the publication date in dd-mm-yyyy format."
+            ),
+        }
+    ]
+}
+
+# Fixed part of every search payload; read-only so no call can mutate it.
+_SEARCH_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+    {
+        "sources": ("web", "news"),
+        "scrapeOptions": SEARCH_SCRAPE_OPTIONS,
+    }
+)
+
+
 def call_firecrawl_search(statement: str, limit: int = 5) -> Dict[str, Any]:
     """
     Low-level call to Firecrawl's /v2/search endpoint for a given statement.
@@ -29,60 +110,63 @@ def call_firecrawl_search(statement: str, limit: int = 5) -> Dict[str, Any]:
     # CAP LIMIT AT 20
     limit = min(limit, 20)
 
-    payload = {
-        "query": statement,
-        "sources": ["web", "news"],
-        "limit": limit,
-        "scrapeOptions": {
-            "formats": [
-                {
-                    "type": "json",
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string"},
-                            "url": {"type": "string"},
-                            "description": {"type": "string"},
-                            "source_name": {"type": "string"},
-                            "source_type": {"type": "string"},
-                            "source_class": {"type": "string"},
-                            "source_country": {"type": "string"},
-                            "historical_verdicts": {"type": "string"},
-                            "publish_date": {"type": "string", "format": "date"},
-                        },
-                        "required": ["url"],
-                    },
-                    "prompt": (
-                        "Extract the following fields for this result: "
-                        "title of the article, direct URL, a brief description, "
-                        "the name of the publication (source_name), the country of the publication (source_country), "
-                        "any historical verdicts related to the statements (historical_verdicts), "
-                        "the type of publication source class (state_media/mainstream/partisan/unknown), and the publication date in dd-mm-yyyy format."
-                    ),
-                }
-            ]
-        },
-    }
-
-    headers = {
-        "Authorization": f"Bearer {FIRECRAWL_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    payload = {"query": statement, "limit": limit, **_SEARCH_TEMPLATE}
 
     try:
-        response = requests.post(
+        response = _SESSION.post(
             FIRECRAWL_SEARCH_URL,
-            json=payload,
-            headers=headers,
+            data=orjson.dumps(payload),
             timeout=60,  # KEEP timeout at 60s as you requested
         )
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return orjson.loads(response.content)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         body = getattr(e.response, "text", None) if getattr(e, "response", None) else None
         raise FirecrawlError(f"Firecrawl API error: {e}. Body: {body}") from e
 
 
+def _cached_call_firecrawl_search(statement: str, limit: int) -> Dict[str, Any]:
+    """
+    `call_firecrawl_search` memoised for SEARCH_CACHE_TTL_SECONDS per
+    (normalized statement, limit). Callers must not mutate the response.
+    """
+    key = hashlib.blake2b(
+        f"{limit}\x00{statement.strip()}".encode("utf-8"), digest_size=16
+    ).digest()
+    now = time.monotonic()
+    with _SEARCH_CACHE_LOCK:
+        hit = _SEARCH_CACHE.get(key)
+        if hit is not None and now - hit[0] < SEARCH_CACHE_TTL_SECONDS:
+            return hit[1]
+
+    api_data = call_firecrawl_search(statement=statement, limit=limit)
+
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (now, api_data)
+        _SEARCH_CACHE.move_to_end(key)
+        while len(_SEARCH_CACHE) > SEARCH_CACHE_MAXSIZE:
+            _SEARCH_CACHE.popitem(last=False)
+    return api_data
+
+
+def _validate_sources(candidates: List[Dict[str, Any]]) -> List[SourceInfo]:
+    """
+    Validate all candidate dicts in one pass; if any entry is invalid, fall
+    back to per-item validation so only the bad entries are dropped.
+    """
+    try:
+        return _SOURCE_LIST_ADAPTER.validate_python(candidates)
+    except ValidationError:
+        sources: List[SourceInfo] = []
+        for info in candidates:
+            try:
+                sources.append(SourceInfo.model_validate(info))
+            except ValidationError:
+                # Skip invalid entries, but continue processing others.
+                continue
+        return sources
+
+
 def run_fact_finder(statement: str, limit: int = 5) -> FactFinderResult:
     """
     High-level Fact-Finder logic:
@@ -92,45 +176,56 @@ def run_fact_finder(statement: str, limit: int = 5) -> FactFinderResult:
     - Persists them to memory (both file-backed and session).
     - Returns a FactFinderResult instance.
     """
-    api_data = call_firecrawl_search(statement=statement, limit=limit)
+    api_data = _cached_call_firecrawl_search(statement=statement, limit=limit)
 
-    all_sources: List[SourceInfo] = []
-    seen_urls: set[str] = set()
+    candidates: List[Dict[str, Any]] = []
 
     search_data = api_data.get("data", {})
 
-    for source_type in ["news", "web"]:
-        results = search_data.get(source_type, [])
-        for result in results:
-            structured_info = result.get("json")
-            if not structured_info or not isinstance(structured_info, dict):
-                continue
-
-            url = structured_info.get("url")
-            if not url or url in seen_urls:
-                continue
-
-            structured_info["source_type"] = source_type
-
-            try:
-                source = SourceInfo(**structured_info)
-            except ValidationError:
-                # Skip invalid entries, but continue processing others.
-                continue
-
-            all_sources.append(source)
-            seen_urls.add(url)
+    # One flat pass over (source_type, result) pairs; news first, then web.
+    results = chain.from_iterable(
+        ((source_type, result) for result in search_data.get(source_type, []))
+        for source_type in ("news", "web")
+    )
+    for source_type, result in results:
+        structured_info = result.get("json")
+        if not structured_info or not isinstance(structured_info, dict):
+            continue
+
+        # Cheap pre-check for the most common bad row (missing or
+        # non-http URL) so it never reaches Pydantic validation.
+        url = structured_info.get("url")
+        if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            continue
+
+        # Copy rather than stamp in place: the response may be cached.
+        candidates.append({**structured_info, "source_type": source_type})
+
+    # Dedupe after validation so an invalid entry never shadows a later
+    # valid one for the same page. Keyed on the canonical URL so scheme/host
+    # case, "www.", trailing slashes and tracking params don't slip through.
+    all_sources: List[SourceInfo] = []
+    seen_urls: set[str] = set()
+    for source in _validate_sources(candidates):
+        key = canonical_url(source.url)
+        if key in seen_urls:
+            continue
+        all_sources.append(source)
+        seen_urls.add(key)
 
     # Normalize statement minimally
     normalized_statement = statement.strip()
 
     fact_result = FactFinderResult(statement=normalized_statement, sources=all_sources)
 
+    # Dump once and share the dict between both persistence layers.
+    result_dict = fact_result.model_dump()
+
     # Persist to file-backed local memory (so you can inspect anytime)
     file_memory = LocalFactFinderMemory()
-    file_memory.save_result(fact_result)
+    file_memory.save_result_dict(fact_result.statement, result_dict)
 
     # Persist to in-memory session store (for this process / session)
-    save_fact_finder_result_session(fact_result.model_dump())
+    save_fact_finder_result_session(result_dict)
 
     return fact_result
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""URL normalisation shared by the Fact-Finder and Pattern Analyzer tools."""
+
+import urllib.parse
+
+# Query params that only track the click and never change the page content
+TRACKING_QUERY_PARAMS = {"fbclid", "gclid"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form of `url` for deduplication: lower-case scheme and host,
+    no leading "www.", no default port, no trailing slash, no fragment and
+    no utm_* / fbclid / gclid params.
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+
+    host = (parts.hostname or "").removeprefix("www.")
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parts.username is not None:
+        userinfo = parts.netloc.rpartition("@")[0]
+        netloc = f"{userinfo}@{netloc}"
+
+    params = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    kept = [
+        (k, v)
+        for k, v in params
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_QUERY_PARAMS
+    ]
+    query = parts.query if len(kept) == len(params) else urllib.parse.urlencode(kept)
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urllib.parse.urlunsplit((scheme, netloc, path, query, ""))
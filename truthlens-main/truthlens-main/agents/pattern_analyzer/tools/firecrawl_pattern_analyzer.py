@@ -1,19 +1,29 @@
+import hashlib
+import json
 import os
+import random
+import re
 import time
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from agents.fact_finder.schemas.fact_finder_schema import FactFinderResult, SourceInfo
+from agents.fact_finder.tools.url_utils import canonical_url
 from agents.pattern_analyzer.schemas.pattern_analyzer_schema import (
     ArticleAnalysis,
-    Claim,
     ExtractArticle,
     FirecrawlExtractResult,
     PatternAnalysisResult,
 )
+from memory.extract_cache import ExtractCacheMemory
 from memory.local_store import LocalFactFinderMemory
 from memory.pattern_analysis_store import PatternAnalysisMemory
 from memory.session_store import (
@@ -23,29 +33,65 @@ from memory.session_store import (
 
 FIRECRAWL_EXTRACT_URL = "https://api.firecrawl.dev/v2/extract"
 
+# Max extract jobs in flight at once, to stay under Firecrawl's rate limit.
+FIRECRAWL_CONCURRENCY = max(int(os.getenv("FIRECRAWL_CONCURRENCY", "4")), 1)
+
+# A rate-limited (429) job start creates no job, so it is safe to resubmit.
+START_MAX_ATTEMPTS = 3
+
+# Splice each batch's URLs into a pre-encoded request envelope instead of
+# re-serialising the full schema per batch. Set to "0" to encode the plain
+# payload dict every time.
+PREBUILT_EXTRACT_BODY = os.getenv("TRUTHLENS_PREBUILT_EXTRACT_BODY", "1") == "1"
+
+# The extract schema never changes at runtime; generate it once at import.
+_EXTRACT_SCHEMA: Dict[str, Any] = FirecrawlExtractResult.model_json_schema()
+
+_ARTICLE_LIST_ADAPTER = TypeAdapter(List[ArticleAnalysis])
+
+# Status polling backs off exponentially: 1s, 2s, 4s, 8s, then every 15s.
+POLL_INITIAL_DELAY_SECONDS = 1.0
+POLL_MAX_DELAY_SECONDS = 15.0
+
+
+def _build_session() -> requests.Session:
+    """
+    Shared keep-alive session for Firecrawl, so batch starts and status polls
+    reuse pooled TLS connections and transient 429/5xx responses are retried.
+
+    urllib3 does not retry POST on status codes, so a job start is never
+    silently submitted twice.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    session.headers["Content-Type"] = "application/json"
+    return session
+
+
+_SESSION = _build_session()
+
 # Hosts that are primarily video / non-text and should be skipped
 NON_TEXTUAL_HOST_SUBSTRINGS = [
     "vimeo.com",
     "tiktok.com",
     "instagram.com",
 ]
+_NON_TEXT_RE = re.compile("|".join(re.escape(s) for s in NON_TEXTUAL_HOST_SUBSTRINGS), re.I)
 
 
 def is_textual_url(url: str) -> bool:
-    parsed = urllib.parse.urlparse(url)
-    host = parsed.netloc.lower()
-    return not any(bad in host for bad in NON_TEXTUAL_HOST_SUBSTRINGS)
+    return _NON_TEXT_RE.search(urllib.parse.urlsplit(url).netloc) is None
 
 
-def _build_extract_payload(statement: str, urls: List[str]) -> Dict[str, Any]:
-    """
-    Build the payload for Firecrawl /v2/extract using the result_schema.json
-    you validated in the Firecrawl UI.
-    """
-    extract_schema = FirecrawlExtractResult.model_json_schema()
-
+def _build_extract_prompt(statement: str) -> str:
     # Short, schema-focused prompt (safe for ~500 char limit).
-    prompt = (
+    return (
         f'Analyze each article about: "{statement}". '
         "Return JSON with `result`: an array of objects. "
         "Each object must have: `title`, `source_url`, `statistics`, "
@@ -53,28 +99,76 @@ def _build_extract_payload(statement: str, urls: List[str]) -> Dict[str, Any]:
         "`stance`, and `bias_indication`. No extra fields."
     )
 
+
+def _build_extract_payload(statement: str, urls: List[str]) -> Dict[str, Any]:
+    """
+    Build the payload for Firecrawl /v2/extract using the result_schema.json
+    you validated in the Firecrawl UI.
+    """
     return {
         "urls": urls,
-        "prompt": prompt,
-        "schema": extract_schema,
+        "prompt": _build_extract_prompt(statement),
+        "schema": _EXTRACT_SCHEMA,
         "agent": {"model": "FIRE-1"},
     }
 
 
-def _start_extract_job(payload: Dict[str, Any], api_key: str) -> str:
+@lru_cache(maxsize=8)
+def _extract_envelope(statement: str) -> bytes:
+    """
+    orjson-encoded extract payload minus `urls`, with the closing brace
+    stripped so a batch's URLs can be appended (see `_build_extract_body`).
+    """
+    envelope = orjson.dumps(
+        {
+            "prompt": _build_extract_prompt(statement),
+            "schema": _EXTRACT_SCHEMA,
+            "agent": {"model": "FIRE-1"},
+        }
+    )
+    return envelope[:-1]
+
+
+def _build_extract_body(statement: str, urls: List[str]) -> bytes:
+    """Encoded JSON request body for one extract batch."""
+    if not PREBUILT_EXTRACT_BODY:
+        return orjson.dumps(_build_extract_payload(statement=statement, urls=urls))
+    return _extract_envelope(statement) + b',"urls":' + orjson.dumps(urls) + b"}"
+
+
+def _short_hash(value: Any) -> str:
+    """Stable 16-hex-char fingerprint of a JSON-serialisable value."""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded).hexdigest()[:16]
+
+
+def _start_extract_job(body: bytes, url_count: int, api_key: str) -> str:
     headers = {
         "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
     }
-    print(f"[PatternAnalyzer] Starting Firecrawl extract job for {len(payload.get('urls', []))} URLs...")
-    response = requests.post(
-        FIRECRAWL_EXTRACT_URL,
-        json=payload,
-        headers=headers,
-        timeout=90,
-    )
+    print(f"[PatternAnalyzer] Starting Firecrawl extract job for {url_count} URLs...")
+    delay = POLL_INITIAL_DELAY_SECONDS
+    for attempt in range(1, START_MAX_ATTEMPTS + 1):
+        response = _SESSION.post(
+            FIRECRAWL_EXTRACT_URL,
+            data=body,
+            headers=headers,
+            timeout=90,
+        )
+        if response.status_code != 429 or attempt == START_MAX_ATTEMPTS:
+            break
+        retry_after = _retry_after_seconds(response)
+        print(
+            f"[PatternAnalyzer] Extract start rate-limited (attempt {attempt}); "
+            f"retrying in {retry_after if retry_after is not None else delay:.1f}s."
+        )
+        if retry_after is not None:
+            time.sleep(retry_after)
+        else:
+            _poll_sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY_SECONDS)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     print(f"[PatternAnalyzer] Firecrawl start-job response: {repr(data)[:500]}")
     job_id = data.get("id")
     if not job_id:
@@ -82,6 +176,24 @@ def _start_extract_job(payload: Dict[str, Any], api_key: str) -> str:
     return job_id
 
 
+def _retry_after_seconds(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Seconds to wait from a 429 response's Retry-After header, if it gives one
+    (HTTP-date values are ignored and fall back to normal backoff).
+    """
+    if response is None or response.status_code != 429:
+        return None
+    try:
+        return max(float(response.headers.get("Retry-After", "")), 0.0)
+    except ValueError:
+        return None
+
+
+def _poll_sleep(delay: float) -> None:
+    """Sleep for `delay` plus up to 25% jitter, capped at the max poll delay."""
+    time.sleep(min(delay + random.uniform(0, 0.25 * delay), POLL_MAX_DELAY_SECONDS))
+
+
 def _poll_extract_job(job_id: str, api_key: str, timeout_seconds: int = 300) -> Dict[str, Any]:
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -89,16 +201,17 @@ def _poll_extract_job(job_id: str, api_key: str, timeout_seconds: int = 300) ->
     status_url = f"{FIRECRAWL_EXTRACT_URL}/{job_id}"
     start_time = time.time()
     attempt = 0
+    delay = POLL_INITIAL_DELAY_SECONDS
 
     print(f"[PatternAnalyzer] Polling Firecrawl job {job_id} (timeout={timeout_seconds}s)...")
 
     while True:
         attempt += 1
         try:
-            response = requests.get(status_url, headers=headers, timeout=60)
+            response = _SESSION.get(status_url, headers=headers, timeout=60)
             response.raise_for_status()
-            data = response.json()
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             elapsed = time.time() - start_time
             print(f"[PatternAnalyzer] ERROR polling job {job_id} attempt {attempt}: {e}")
             if elapsed > timeout_seconds:
@@ -106,7 +219,12 @@ def _poll_extract_job(job_id: str, api_key: str, timeout_seconds: int = 300) ->
                     f"Firecrawl extract job {job_id} polling timed out after {elapsed:.1f} seconds. "
                     f"Last error: {e}"
                 ) from e
-            time.sleep(5)
+            retry_after = _retry_after_seconds(getattr(e, "response", None))
+            if retry_after is not None:
+                time.sleep(retry_after)
+            else:
+                _poll_sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY_SECONDS)
             continue
 
         status = data.get("status")
@@ -126,7 +244,141 @@ def _poll_extract_job(job_id: str, api_key: str, timeout_seconds: int = 300) ->
                 f"Last known status: {status}"
             )
 
-        time.sleep(5)
+        _poll_sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY_SECONDS)
+
+
+def _to_article_dict(extracted: ExtractArticle, src: Optional[SourceInfo]) -> Dict[str, Any]:
+    """
+    Merge one Firecrawl-extracted article with its Fact-Finder metadata into
+    ArticleAnalysis input; validated in bulk by `_validate_articles`.
+    """
+    # Build key_claims list (single structured claim from Firecrawl)
+    claims: List[Dict[str, Any]] = []
+    if extracted.key_claims and extracted.key_claims.text:
+        claims.append(
+            {
+                "text": extracted.key_claims.text,
+                "modality": extracted.key_claims.modality,
+                "blame_target": extracted.key_claims.blame_target,
+                "evidence": extracted.key_claims.evidence,
+            }
+        )
+
+    return {
+        "url": extracted.source_url,
+        "source_name": getattr(src, "source_name", None) if src else None,
+        "publish_date": getattr(src, "publish_date", None) if src else None,
+        "source_type": getattr(src, "source_type", None) if src else None,
+        "title": extracted.title or (getattr(src, "title", None) if src else None),
+        "source_country": getattr(src, "source_country", None) if src else None,
+        "source_class": getattr(src, "source_class", None) if src else None,
+        "key_claims": claims,
+        "narrative_summary": extracted.narrative_summary,
+        "statistics": extracted.statistics or None,
+        "stance": extracted.stance,
+        "bias_indicators": extracted.bias_indication or None,
+    }
+
+
+def _validate_articles(article_dicts: List[Dict[str, Any]]) -> List[ArticleAnalysis]:
+    """
+    Validate all article dicts in one pass; if any entry is invalid, fall
+    back to per-item validation so only the bad entries are dropped.
+    """
+    try:
+        return _ARTICLE_LIST_ADAPTER.validate_python(article_dicts)
+    except ValidationError:
+        articles: List[ArticleAnalysis] = []
+        for item in article_dicts:
+            try:
+                articles.append(ArticleAnalysis.model_validate(item))
+            except ValidationError as e:
+                print(f"[PatternAnalyzer] Skipping invalid article {item.get('url')!r}: {e}")
+        return articles
+
+
+def _process_batch(
+    batch_index: int,
+    batch_sources: List[SourceInfo],
+    source_lookup_by_url: Dict[str, SourceInfo],
+    statement: str,
+    api_key: str,
+) -> Tuple[List[ArticleAnalysis], Dict[str, Dict[str, Any]]]:
+    """
+    Run one Firecrawl extract job (start + poll) for a batch of sources and
+    merge the extracted data with Fact-Finder metadata.
+
+    `source_lookup_by_url` maps canonical URL -> source for the whole run and
+    is shared read-only across batches.
+
+    Returns the merged articles plus the raw extracted payloads keyed by
+    canonical URL, for the extract cache.
+
+    Errors are logged and yield empty results so one failing batch does not
+    sink the others.
+    """
+    urls = [src.url for src in batch_sources if src.url]
+    if not urls:
+        print(f"[PatternAnalyzer] Batch {batch_index} has no URLs, skipping.")
+        return [], {}
+
+    print(
+        f"[PatternAnalyzer] Starting Firecrawl job for batch {batch_index} "
+        f"with {len(urls)} URLs."
+    )
+
+    body = _build_extract_body(statement=statement, urls=urls)
+
+    try:
+        job_id = _start_extract_job(body=body, url_count=len(urls), api_key=api_key)
+    except Exception as e:
+        print(f"[PatternAnalyzer] ERROR starting extract job for batch {batch_index}: {e}")
+        return [], {}
+
+    print(
+        f"[PatternAnalyzer] Job {job_id} started for batch {batch_index}, "
+        "polling for completion..."
+    )
+
+    try:
+        job_result = _poll_extract_job(job_id=job_id, api_key=api_key, timeout_seconds=300)
+    except TimeoutError as e:
+        print(f"[PatternAnalyzer] TIMEOUT polling job {job_id} for batch {batch_index}: {e}")
+        return [], {}
+    except Exception as e:
+        print(f"[PatternAnalyzer] ERROR polling job {job_id} for batch {batch_index}: {e}")
+        return [], {}
+
+    print(f"[PatternAnalyzer] Job {job_id} for batch {batch_index} completed. Processing data...")
+
+    data_raw = job_result.get("data")
+    print(
+        f"[PatternAnalyzer] Raw 'data' for batch {batch_index}: "
+        f"type={type(data_raw)}, repr={repr(data_raw)[:500]}"
+    )
+
+    if not isinstance(data_raw, dict):
+        print(f"[PatternAnalyzer] Unexpected 'data' type for batch {batch_index}, skipping.")
+        return [], {}
+
+    try:
+        extract = FirecrawlExtractResult.model_validate(data_raw)
+    except ValidationError as e:
+        print(f"[PatternAnalyzer] ValidationError for batch {batch_index}: {e}")
+        return [], {}
+
+    article_dicts: List[Dict[str, Any]] = []
+    extracted_by_url: Dict[str, Dict[str, Any]] = {}
+
+    # The lookup is keyed by canonical URL: Firecrawl may echo back a variant
+    # of the URL we sent (tracking params, fragment, host case).
+    for extracted in extract.result:
+        key = canonical_url(extracted.source_url)
+        article_dicts.append(_to_article_dict(extracted, source_lookup_by_url.get(key)))
+        extracted_by_url[key] = extracted.model_dump()
+
+    return _validate_articles(article_dicts), extracted_by_url
 
 
 def run_pattern_analyzer() -> PatternAnalysisResult:
@@ -159,120 +411,99 @@ def run_pattern_analyzer() -> PatternAnalysisResult:
     statement = fact_result.statement
     print(f"[PatternAnalyzer] Using statement: {statement!r}")
 
-    textual_sources: List[SourceInfo] = [
-        src for src in fact_result.sources if src.url and is_textual_url(src.url)
-    ]
+    # Extract is billed per URL, so collapse news/web overlap and tracking
+    # variants of the same page before batching (first occurrence wins).
+    # Doubles as the canonical-URL source lookup for every batch.
+    unique_sources: Dict[str, SourceInfo] = {}
+    for src in fact_result.sources:
+        if src.url and is_textual_url(src.url):
+            unique_sources.setdefault(canonical_url(src.url), src)
+    textual_sources: List[SourceInfo] = list(unique_sources.values())
     print(f"[PatternAnalyzer] Total textual sources: {len(textual_sources)}")
     if not textual_sources:
         raise ValueError("No textual sources available (non-video) to analyze for this statement.")
 
+    # URLs already extracted with the same schema and prompt are served from
+    # the local cache and never re-submitted to Firecrawl.
+    extract_cache = ExtractCacheMemory()
+    schema_hash = _short_hash(_EXTRACT_SCHEMA)
+    prompt_hash = _short_hash(_build_extract_prompt(statement))
+    cached_payloads = extract_cache.get_many(unique_sources.keys(), schema_hash, prompt_hash)
+
+    cached_article_dicts: List[Dict[str, Any]] = []
+    pending_sources: List[SourceInfo] = []
+    for key, src in unique_sources.items():
+        payload = cached_payloads.get(key)
+        if payload is not None:
+            try:
+                cached_article_dicts.append(_to_article_dict(ExtractArticle.model_validate(payload), src))
+                continue
+            except ValidationError:
+                pass
+        pending_sources.append(src)
+    all_articles: List[ArticleAnalysis] = _validate_articles(cached_article_dicts)
+    print(
+        f"[PatternAnalyzer] Extract cache: {len(all_articles)} hit(s), "
+        f"{len(pending_sources)} URL(s) to extract."
+    )
+
     BATCH_SIZE = 5
     batches: List[List[SourceInfo]] = [
-        textual_sources[i : i + BATCH_SIZE] for i in range(0, len(textual_sources), BATCH_SIZE)
+        pending_sources[i : i + BATCH_SIZE] for i in range(0, len(pending_sources), BATCH_SIZE)
     ]
     print(f"[PatternAnalyzer] URL batches: {len(batches)} (batch size {BATCH_SIZE})")
 
-    api_key = os.environ.get("FIRECRAWL_API_KEY")
-    if not api_key:
-        raise RuntimeError("FIRECRAWL_API_KEY is not set in the environment.")
-
-    all_articles: List[ArticleAnalysis] = []
-
-    for batch_index, batch_sources in enumerate(batches, start=1):
-        urls = [src.url for src in batch_sources if src.url]
-        if not urls:
-            print(f"[PatternAnalyzer] Batch {batch_index} has no URLs, skipping.")
-            continue
-
-        print(
-            f"[PatternAnalyzer] Starting Firecrawl job for batch {batch_index} "
-            f"with {len(urls)} URLs."
-        )
-
-        payload = _build_extract_payload(statement=statement, urls=urls)
-
-        try:
-            job_id = _start_extract_job(payload=payload, api_key=api_key)
-        except Exception as e:
-            print(f"[PatternAnalyzer] ERROR starting extract job for batch {batch_index}: {e}")
-            continue
-
-        print(
-            f"[PatternAnalyzer] Job {job_id} started for batch {batch_index}, "
-            "polling for completion..."
-        )
-
-        try:
-            job_result = _poll_extract_job(job_id=job_id, api_key=api_key, timeout_seconds=300)
-        except TimeoutError as e:
-            print(f"[PatternAnalyzer] TIMEOUT polling job {job_id} for batch {batch_index}: {e}")
-            continue
-        except Exception as e:
-            print(f"[PatternAnalyzer] ERROR polling job {job_id} for batch {batch_index}: {e}")
-            continue
-
-        print(f"[PatternAnalyzer] Job {job_id} for batch {batch_index} completed. Processing data...")
-
-        data_raw = job_result.get("data")
-        print(
-            f"[PatternAnalyzer] Raw 'data' for batch {batch_index}: "
-            f"type={type(data_raw)}, repr={repr(data_raw)[:500]}"
-        )
-
-        if not isinstance(data_raw, dict):
-            print(f"[PatternAnalyzer] Unexpected 'data' type for batch {batch_index}, skipping.")
-            continue
-
-        try:
-            extract = FirecrawlExtractResult.model_validate(data_raw)
-        except ValidationError as e:
-            print(f"[PatternAnalyzer] ValidationError for batch {batch_index}: {e}")
-            continue
-
-        source_lookup_by_url: Dict[str, SourceInfo] = {
-            src.url: src for src in batch_sources if src.url
-        }
-
-        batch_article_count_before = len(all_articles)
-
-        for extracted in extract.result:
-            src = source_lookup_by_url.get(extracted.source_url)
-
-            # Build key_claims list (single structured claim from Firecrawl)
-            claims: List[Claim] = []
-            if extracted.key_claims and extracted.key_claims.text:
-                claims.append(
-                    Claim(
-                        text=extracted.key_claims.text,
-                        modality=extracted.key_claims.modality,
-                        blame_target=extracted.key_claims.blame_target,
-                        evidence=extracted.key_claims.evidence,
+    if batches:
+        api_key = os.environ.get("FIRECRAWL_API_KEY")
+        if not api_key:
+            raise RuntimeError("FIRECRAWL_API_KEY is not set in the environment.")
+
+        pattern_memory = PatternAnalysisMemory()
+        batch_results: Dict[int, List[ArticleAnalysis]] = {}
+        persisted_dicts: List[Dict[str, Any]] = [a.model_dump() for a in all_articles]
+        persisted = False
+
+        # Extract jobs are remote and I/O-bound: start and poll up to
+        # FIRECRAWL_CONCURRENCY batches at once. Each batch is persisted (extract cache, pattern store, session)
+        # as soon as it completes, so a crash mid-run loses no finished work.
+        with ThreadPoolExecutor(max_workers=min(len(batches), FIRECRAWL_CONCURRENCY)) as executor:
+            futures = {
+                executor.submit(
+                    _process_batch, batch_index, batch_sources, unique_sources, statement, api_key
+                ): batch_index
+                for batch_index, batch_sources in enumerate(batches, start=1)
+            }
+            for future in as_completed(futures):
+                batch_index = futures[future]
+                batch_articles, batch_payloads = future.result()
+                batch_results[batch_index] = batch_articles
+                extract_cache.put_many(batch_payloads, schema_hash, prompt_hash)
+
+                if batch_articles:
+                    new_dicts = [a.model_dump() for a in batch_articles]
+                    if persisted:
+                        pattern_memory.append_articles(statement, new_dicts)
+                    else:
+                        # First write of this run replaces any stale entry.
+                        pattern_memory.save_result_dict(
+                            statement,
+                            {"statement": statement, "analyzed_articles": persisted_dicts + new_dicts},
+                        )
+                        persisted = True
+                    persisted_dicts.extend(new_dicts)
+                    save_pattern_analysis_result_session(
+                        {"statement": statement, "analyzed_articles": list(persisted_dicts)}
                     )
-                )
-
-            article = ArticleAnalysis(
-                url=extracted.source_url,
-                source_name=getattr(src, "source_name", None) if src else None,
-                publish_date=getattr(src, "publish_date", None) if src else None,
-                source_type=getattr(src, "source_type", None) if src else None,
-                title=extracted.title or (getattr(src, "title", None) if src else None),
-                source_country=getattr(src, "source_country", None) if src else None,
-                source_class=getattr(src, "source_class", None) if src else None,
-                key_claims=claims,
-                narrative_summary=extracted.narrative_summary,
-                statistics=extracted.statistics or None,
-                stance=extracted.stance,
-                bias_indicators=extracted.bias_indication or None,
-            )
 
-            all_articles.append(article)
+                print(
+                    f"[PatternAnalyzer] Batch {batch_index} contributed "
+                    f"{len(batch_articles)} articles. "
+                    f"Total so far: {len(persisted_dicts)}."
+                )
 
-        batch_article_count_after = len(all_articles)
-        print(
-            f"[PatternAnalyzer] Batch {batch_index} contributed "
-            f"{batch_article_count_after - batch_article_count_before} articles. "
-            f"Total so far: {batch_article_count_after}."
-        )
+        # Final result keeps batch order regardless of completion order.
+        for batch_index in sorted(batch_results):
+            all_articles.extend(batch_results[batch_index])
 
     if not all_articles:
         raise RuntimeError(
@@ -282,10 +513,12 @@ def run_pattern_analyzer() -> PatternAnalysisResult:
     result = PatternAnalysisResult(statement=fact_result.statement, analyzed_articles=all_articles)
 
     print("[PatternAnalyzer] Saving PatternAnalysisResult to local and session memory.")
-    pattern_memory = PatternAnalysisMemory()
-    pattern_memory.save_result(result)
+    # Consolidated save: rewrites the incrementally persisted entry in batch
+    # order. Dump once and share the dict between both persistence layers.
+    result_dict = result.model_dump()
+    PatternAnalysisMemory().save_result_dict(result.statement, result_dict)
 
-    save_pattern_analysis_result_session(result.model_dump())
+    save_pattern_analysis_result_session(result_dict)
 
     print("[PatternAnalyzer] Done. Returning result.")
     return result
\ No newline at end of file
@@ -2,10 +2,10 @@ from typing import Any, Dict
 
 from google.adk.agents import Agent
 
-from agents.counterpoint.tools.counterpoint_tool import counterpoint_tool
+from agents.counterpoint.tools.counterpoint_tool import counterpoint_tool_async
 
 
-def counterpoint_agent_tool() -> Dict[str, Any]:
+async def counterpoint_agent_tool() -> Dict[str, Any]:
     """
     Tool interface for the Counterpoint agent when used via ADK.
 
@@ -15,8 +15,10 @@ def counterpoint_agent_tool() -> Dict[str, Any]:
       - saves it to CounterpointMemory,
       - returns it as dict)
     and passes that JSON directly back to the caller.
+
+    Declared async so the Gemini round-trip doesn't block ADK's event loop.
     """
-    return counterpoint_tool()
+    return await counterpoint_tool_async()
 
 
 COUNTERPOINT_SYSTEM_PROMPT = """
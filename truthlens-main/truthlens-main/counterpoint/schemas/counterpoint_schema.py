@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+from enum import Enum
 from typing import List, Literal, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-CounterpointType = Literal[
-    "subject_denial",          # direct denial by an actor (e.g., Chinese FM)
-    "alternative_explanation", # another plausible cause/story
-    "scope_limitation",        # overgeneralization, cherry-picking
-    "methodological_caveat",   # single-source, weak evidence, etc.
-    "value_judgment",          # normative framing vs. factual claim
-]
+class CounterpointType(str, Enum):
+    SUBJECT_DENIAL = "subject_denial"                    # direct denial by an actor (e.g., Chinese FM)
+    ALTERNATIVE_EXPLANATION = "alternative_explanation"  # another plausible cause/story
+    SCOPE_LIMITATION = "scope_limitation"                # overgeneralization, cherry-picking
+    METHODOLOGICAL_CAVEAT = "methodological_caveat"      # single-source, weak evidence, etc.
+    VALUE_JUDGMENT = "value_judgment"                    # normative framing vs. factual claim
 
 
 class Counterpoint(BaseModel):
+    # Store/dump `type` as its plain string value
+    model_config = ConfigDict(use_enum_values=True)
+
     id: str
 
     # Which Critic structure this is attached to
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import os
-from typing import Any, Dict, List
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import google.generativeai as genai
+import orjson
 
 from agents.critic.schemas.critic_schema import CriticResult
 from agents.pattern_analyzer.schemas.pattern_analyzer_schema import (
@@ -14,10 +19,15 @@ from agents.pattern_analyzer.schemas.pattern_analyzer_schema import (
 from agents.counterpoint.schemas.counterpoint_schema import (
     Counterpoint,
     CounterpointResult,
+    CounterpointType,
 )
 from memory.critic_store import CriticMemory
 from memory.pattern_analysis_store import PatternAnalysisMemory
 from memory.local_counterpoint_store import CounterpointMemory
+from memory.session_store import (
+    get_latest_critic_result_session,
+    get_latest_pattern_analysis_result_session,
+)
 
 
 # --- Helpers to load upstream results ----------------------------------------
@@ -25,12 +35,16 @@ from memory.local_counterpoint_store import CounterpointMemory
 
 def _load_latest_critic() -> CriticResult:
     """
-    Load the latest CriticResult from local CriticMemory.
+    Load the latest CriticResult, from session memory if this process ran the
+    Critic, otherwise from local CriticMemory.
 
-    Mirrors your existing pattern: read the JSON store and take the last key.
-    CriticMemory.save_result() already clears the store and keeps only one entry,
-    so this effectively returns the latest Critic run.
+    CriticMemory.save_result() replaces the whole store on every run, so it
+    holds exactly one entry: the latest Critic run.
     """
+    session_data = get_latest_critic_result_session()
+    if session_data is not None:
+        return CriticResult(**session_data)
+
     memory = CriticMemory()
     store = memory._read_store()  # type: ignore[attr-defined]
 
@@ -40,17 +54,22 @@ def _load_latest_critic() -> CriticResult:
             "Run the Critic agent first."
         )
 
-    last_key = next(reversed(store))
-    data = store[last_key]
+    assert len(store) == 1, "CriticMemory should hold exactly one entry"
+    data = next(iter(store.values()))
     return CriticResult(**data)
 
 
 def _load_latest_pattern_analysis() -> PatternAnalysisResult:
     """
-    Load the latest PatternAnalysisResult from local PatternAnalysisMemory.
+    Load the latest PatternAnalysisResult, from session memory if this process
+    ran the Pattern Analyzer, otherwise from local PatternAnalysisMemory.
 
     Same pattern: read underlying store and take the last key.
     """
+    session_data = get_latest_pattern_analysis_result_session()
+    if session_data is not None:
+        return PatternAnalysisResult(**session_data)
+
     memory = PatternAnalysisMemory()
     store = memory._read_store()  # type: ignore[attr-defined]
 
@@ -66,55 +85,40 @@ def _load_latest_pattern_analysis() -> PatternAnalysisResult:
 
 
 def _collect_allowed_urls(pa: PatternAnalysisResult) -> List[str]:
-    urls: List[str] = []
-    for art in pa.analyzed_articles:
-        if art.url:
-            urls.append(art.url)
     # Deduplicate while preserving order
-    seen = set()
-    result: List[str] = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            result.append(u)
-    return result
+    return list(dict.fromkeys(art.url for art in pa.analyzed_articles if art.url))
 
 
 # --- LLM call to propose counterpoints ---------------------------------------
 
 
-def _generate_counterpoints_with_llm(
-    statement: str,
-    critic: CriticResult,
-    pa: PatternAnalysisResult,
-    allowed_urls: List[str],
-) -> List[Dict[str, Any]]:
-    """
-    Use Gemini 2.5 Flash to propose counterpoints for Critic's implication chains.
-
-    Returns a list of dicts with keys:
-      - id
-      - target_chain_index
-      - target_step_index
-      - type
-      - text
-      - based_on_sources (subset of allowed_urls)
-      - uses_general_knowledge (bool)
-      - strength
-      - notes
-    """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        print("[Counterpoint] WARNING: GOOGLE_API_KEY not set. Returning no counterpoints.")
-        return []
+_MODEL: Optional[genai.GenerativeModel] = None
+_MODEL_LOCK = threading.Lock()
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-2.5-flash")
 
-    critic_json = critic.model_dump()
-    pa_json = pa.model_dump()
+def _get_model() -> Optional[genai.GenerativeModel]:
+    """
+    Configure genai and build the Gemini model once per process.
 
-    prompt = f"""
+    Returns None (and retries on the next call) while GOOGLE_API_KEY is unset.
+    """
+    global _MODEL
+    if _MODEL is not None:
+        return _MODEL
+    with _MODEL_LOCK:
+        if _MODEL is None:
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                return None
+            genai.configure(api_key=api_key)
+            _MODEL = genai.GenerativeModel("gemini-2.5-flash")
+    return _MODEL
+
+
+# Static part of the Counterpoint prompt. The per-run inputs are appended at
+# the tail so this block is an identical prefix on every call, which lets
+# Gemini reuse its cached prefill.
+PROMPT_PREFIX = """\
 You are the Counterpoint agent in the TruthLens pipeline.
 
 The upstream agents have already:
@@ -138,17 +142,11 @@ Constraints:
 - For each counterpoint, choose zero or more URLs from allowed_urls that are most relevant.
 - If you use general knowledge beyond what is clearly in the sources, set uses_general_knowledge to true.
 
-Input:
-- statement: {statement}
-- critic_result (JSON): {json.dumps(critic_json, ensure_ascii=False)}
-- pattern_analysis_result (JSON): {json.dumps(pa_json, ensure_ascii=False)}
-- allowed_urls (JSON array): {json.dumps(allowed_urls, ensure_ascii=False)}
-
 Output:
 Return ONLY a JSON array of counterpoint objects with this exact schema:
 
 [
-  {{
+  {
     "id": "cp_1",
     "target_chain_index": 0,
     "target_step_index": 0,
@@ -158,23 +156,111 @@ Return ONLY a JSON array of counterpoint objects with this exact schema:
     "uses_general_knowledge": true or false,
     "strength": "minor" | "moderate" | "strong",
     "notes": "Optional additional explanation; can be empty string."
-  }},
+  },
   ...
 ]
 
 Do NOT wrap the JSON in markdown fences.
 Do NOT add any explanation outside this JSON array.
-""".strip()
+
+Input:"""
+
+# Optional ```json / ``` fence wrapped around the whole model response.
+_FENCE_RE = re.compile(r"\A```(?:json|JSON)?\s*|\s*```\Z")
+
+# On-disk cache of LLM counterpoints, keyed by a hash of the full prompt.
+_COUNTERPOINT_CACHE_DIR = Path(
+    os.getenv("TRUTHLENS_COUNTERPOINT_CACHE_DIR", "./memory/counterpoint_llm_cache")
+)
+
+
+def _counterpoint_cache_path(prompt: str) -> Path:
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return _COUNTERPOINT_CACHE_DIR / f"{digest}.json"
+
+
+def _read_cached_counterpoints(path: Path) -> Optional[List[Dict[str, Any]]]:
+    try:
+        with path.open("rb") as f:
+            data = orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return None
+    return data if isinstance(data, list) else None
+
+
+def _write_cached_counterpoints(path: Path, counterpoints: List[Dict[str, Any]]) -> None:
+    """
+    Write-through after a successful LLM call. Written to a temp file and
+    renamed so concurrent readers never see a partial entry.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(orjson.dumps(counterpoints))
+        os.replace(tmp, path)
+    except (OSError, TypeError) as e:
+        print(f"[Counterpoint] Could not write counterpoint cache {path}: {e}")
+
+
+async def _generate_counterpoints_with_llm(
+    statement: str,
+    critic: CriticResult,
+    pa: PatternAnalysisResult,
+    allowed_urls: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Use Gemini 2.5 Flash to propose counterpoints for Critic's implication chains.
+
+    Returns a list of dicts with keys:
+      - id
+      - target_chain_index
+      - target_step_index
+      - type
+      - text
+      - based_on_sources (subset of allowed_urls)
+      - uses_general_knowledge (bool)
+      - strength
+      - notes
+
+    Responses are cached on disk by prompt hash, so unchanged Critic and
+    Pattern Analysis inputs never trigger a second Gemini call.
+    """
+    # Assemble from chunks so the large model JSON is copied only once;
+    # the models serialise straight to JSON without intermediate dicts.
+    prompt = "".join(
+        [
+            PROMPT_PREFIX,
+            "\n- statement: ",
+            statement,
+            "\n- critic_result (JSON): ",
+            critic.model_dump_json(),
+            "\n- pattern_analysis_result (JSON): ",
+            pa.model_dump_json(),
+            "\n- allowed_urls (JSON array): ",
+            orjson.dumps(allowed_urls).decode(),
+        ]
+    )
+
+    cache_path = _counterpoint_cache_path(prompt)
+    cached = _read_cached_counterpoints(cache_path)
+    if cached is not None:
+        return cached
+
+    model = _get_model()
+    if model is None:
+        print("[Counterpoint] WARNING: GOOGLE_API_KEY not set. Returning no counterpoints.")
+        return []
 
     try:
-        response = model.generate_content(prompt)
-        text = (response.text or "").strip()
-        if text.startswith("```"):
-            text = text.strip("`")
-        data = json.loads(text)
+        response = await model.generate_content_async(prompt)
+        text = _FENCE_RE.sub("", (response.text or "").strip()).strip()
+        data = orjson.loads(text)
         if not isinstance(data, list):
             print("[Counterpoint] LLM returned non-list JSON; ignoring.")
             return []
+        if data:
+            _write_cached_counterpoints(cache_path, data)
         return data
     except Exception as e:
         print(f"[Counterpoint] Error generating counterpoints: {e}")
@@ -183,6 +269,9 @@ Do NOT add any explanation outside this JSON array.
 
 # --- Post-processing and tool interface --------------------------------------
 
+_ALLOWED_TYPES = frozenset(t.value for t in CounterpointType)
+_ALLOWED_STRENGTHS = frozenset({"minor", "moderate", "strong"})
+
 
 def _clean_and_validate_counterpoints(
     raw: List[Dict[str, Any]],
@@ -195,8 +284,11 @@ def _clean_and_validate_counterpoints(
       - based_on_sources are subset of allowed_urls,
       - types/strengths are valid,
       - basic fields are non-empty.
+
+    Every field is checked here, so the Counterpoints are built with
+    model_construct() and skip a second round of Pydantic validation.
     """
-    result: List[Counterpoint] = []
+    cleaned: List[Counterpoint] = []
 
     num_chains = len(critic.implication_chains)
     allowed_set = set(allowed_urls)
@@ -215,25 +307,15 @@ def _clean_and_validate_counterpoints(
                 continue
             if t_step < 0 or t_step >= len(critic.implication_chains[t_chain].steps):
                 continue
-            if ctype not in {
-                "subject_denial",
-                "alternative_explanation",
-                "scope_limitation",
-                "methodological_caveat",
-                "value_judgment",
-            }:
+            if ctype not in _ALLOWED_TYPES:
                 continue
 
             srcs = item.get("based_on_sources", []) or []
-            clean_srcs: List[str] = []
-            for u in srcs:
-                su = str(u).strip()
-                if su in allowed_set:
-                    clean_srcs.append(su)
+            clean_srcs = [su for su in (str(u).strip() for u in srcs) if su in allowed_set]
 
             uses_gk = bool(item.get("uses_general_knowledge", False))
             strength = item.get("strength", "moderate")
-            if strength not in {"minor", "moderate", "strong"}:
+            if strength not in _ALLOWED_STRENGTHS:
                 strength = "moderate"
 
             notes_raw = item.get("notes", "")
@@ -241,40 +323,44 @@ def _clean_and_validate_counterpoints(
             if notes == "":
                 notes = None
 
-            cp = Counterpoint(
-                id=cid,
-                target_chain_index=t_chain,
-                target_step_index=t_step,
-                type=ctype,  # type: ignore[arg-type]
-                text=text,
-                based_on_sources=clean_srcs,
-                uses_general_knowledge=uses_gk,
-                strength=strength,  # type: ignore[arg-type]
-                notes=notes,
+            cleaned.append(
+                Counterpoint.model_construct(
+                    id=cid,
+                    target_chain_index=t_chain,
+                    target_step_index=t_step,
+                    type=ctype,
+                    text=text,
+                    based_on_sources=clean_srcs,
+                    uses_general_knowledge=uses_gk,
+                    strength=strength,
+                    notes=notes,
+                )
             )
-            result.append(cp)
         except Exception as e:
             print(f"[Counterpoint] Skipping invalid counterpoint item: {e}")
             continue
 
-    return result
+    return cleaned
 
 
-def run_counterpoint() -> CounterpointResult:
+async def run_counterpoint_async() -> CounterpointResult:
     """
     Main Counterpoint pipeline function.
 
-    - Load latest CriticResult and PatternAnalysisResult from local memory.
+    - Load latest CriticResult and PatternAnalysisResult from local memory
+      (concurrently, off the event loop).
     - Use Gemini 2.5 Flash to propose counterpoints for implication chains.
     - Clean and validate the counterpoints.
     - Save CounterpointResult to local CounterpointMemory.
     - Return CounterpointResult.
     """
-    critic = _load_latest_critic()
-    pa = _load_latest_pattern_analysis()
+    critic, pa = await asyncio.gather(
+        asyncio.to_thread(_load_latest_critic),
+        asyncio.to_thread(_load_latest_pattern_analysis),
+    )
     allowed_urls = _collect_allowed_urls(pa)
 
-    raw_cps = _generate_counterpoints_with_llm(
+    raw_cps = await _generate_counterpoints_with_llm(
         statement=critic.statement,
         critic=critic,
         pa=pa,
@@ -297,16 +383,34 @@ def run_counterpoint() -> CounterpointResult:
             "sources present relatively aligned narratives on the core claims."
         )
 
+    # Validated at the boundary; the already-built Counterpoint instances are
+    # accepted as-is rather than re-validated.
     result = CounterpointResult(
         statement=critic.statement,
         high_level_summary=high_level_summary,
         counterpoints=counterpoints,
     )
 
-    CounterpointMemory().save_result(result)
+    await asyncio.to_thread(CounterpointMemory().save_result, result)
     return result
 
 
+def run_counterpoint() -> CounterpointResult:
+    """
+    Synchronous entry point for callers without a running event loop.
+
+    Code already inside an event loop (e.g. ADK tools) should await
+    run_counterpoint_async() instead.
+    """
+    return asyncio.run(run_counterpoint_async())
+
+
+async def counterpoint_tool_async() -> Dict[str, Any]:
+    """Async variant of counterpoint_tool() for callers inside an event loop."""
+    result = await run_counterpoint_async()
+    return result.model_dump()
+
+
 def counterpoint_tool() -> Dict[str, Any]:
     """
     Tool interface for the Counterpoint agent.
@@ -1,8 +1,8 @@
-import json
 import os
 from typing import Any, Dict, Optional
 
 from agents.counterpoint.schemas.counterpoint_schema import CounterpointResult
+from memory.store_utils import read_json_store, write_json_store, write_json_store_bytes
 
 DEFAULT_COUNTERPOINT_MEMORY_PATH = os.getenv(
     "TRUTHLENS_COUNTERPOINT_MEMORY_PATH",
@@ -25,23 +25,17 @@ class CounterpointMemory:
             self._write_store({})
 
     def _read_store(self) -> Dict[str, Any]:
-        if not os.path.exists(self.path):
-            return {}
-        try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
+        return read_json_store(self.path)
 
     def _write_store(self, store: Dict[str, Any]) -> None:
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(store, f, indent=2, ensure_ascii=False)
+        write_json_store(self.path, store)
 
     def save_result(self, result: CounterpointResult) -> None:
         """
         Save the latest CounterpointResult, overwriting any previous content.
         """
-        self._write_store(result.model_dump())
+        # Serialise straight from the model, skipping the intermediate dict.
+        write_json_store_bytes(self.path, result.model_dump_json(indent=2).encode("utf-8"))
 
     def get_latest_result(self) -> Optional[CounterpointResult]:
         store = self._read_store()
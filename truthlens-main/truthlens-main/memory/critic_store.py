@@ -1,8 +1,8 @@
-import json
 import os
 from typing import Any, Dict
 
 from agents.critic.schemas.critic_schema import CriticResult
+from memory.store_utils import read_json_store, write_json_store
 
 
 class CriticMemory:
@@ -22,17 +22,10 @@ class CriticMemory:
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
     def _read_store(self) -> Dict[str, Any]:
-        if not os.path.exists(self.path):
-            return {}
-        try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
+        return read_json_store(self.path)
 
     def _write_store(self, store: Dict[str, Any]) -> None:
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(store, f, indent=2, ensure_ascii=False)
+        write_json_store(self.path, store)
 
     def save_result(self, result: CriticResult) -> None:
         """
@@ -42,7 +35,8 @@ class CriticMemory:
         latest Critic run. This keeps downstream agents simple: they
         can just load the "last" entry without worrying about history.
         """
-        store = self._read_store()
-        store.clear()
-        store[result.statement] = result.model_dump()
-        self._write_store(store)
\ No newline at end of file
+        self.save_result_dict(result.statement, result.model_dump())
+
+    def save_result_dict(self, statement: str, result_dict: Dict[str, Any]) -> None:
+        """Save an already-dumped CriticResult, replacing previous entries."""
+        self._write_store({statement: result_dict})
\ No newline at end of file
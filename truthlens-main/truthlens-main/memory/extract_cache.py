@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from memory.store_utils import read_json_store, write_json_store
+
+_DEFAULT_EXTRACT_CACHE_PATH = os.getenv("TRUTHLENS_EXTRACT_CACHE_PATH", "./memory/extract_cache.json")
+
+# Cached extractions older than this are re-submitted to Firecrawl.
+EXTRACT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class ExtractCacheMemory:
+    """
+    JSON-file-backed cache of Firecrawl extract results, keyed by canonical URL.
+
+    Each entry records the hashes of the extract schema and prompt it was
+    produced with, so a change to either invalidates it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ttl_seconds: int = EXTRACT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path or _DEFAULT_EXTRACT_CACHE_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            self._write_store({})
+
+    def _read_store(self) -> Dict[str, Any]:
+        return read_json_store(self.path)
+
+    def _write_store(self, data: Dict[str, Any]) -> None:
+        # Machine-only cache; skip pretty-printing.
+        write_json_store(self.path, data, indent=False)
+
+    def get_many(
+        self,
+        urls: Iterable[str],
+        schema_hash: str,
+        prompt_hash: str,
+        now: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return {url: payload} for every url with a fresh, matching entry."""
+        store = self._read_store()
+        cutoff = (now if now is not None else time.time()) - self.ttl_seconds
+        hits: Dict[str, Dict[str, Any]] = {}
+        for url in urls:
+            entry = store.get(url)
+            if (
+                entry
+                and entry.get("schema_hash") == schema_hash
+                and entry.get("prompt_hash") == prompt_hash
+                and entry.get("ts", 0) >= cutoff
+            ):
+                hits[url] = entry["payload"]
+        return hits
+
+    def put_many(
+        self,
+        payloads: Dict[str, Dict[str, Any]],
+        schema_hash: str,
+        prompt_hash: str,
+    ) -> None:
+        """Store {url: payload} entries, replacing any existing ones."""
+        if not payloads:
+            return
+        store = self._read_store()
+        ts = int(time.time())
+        for url, payload in payloads.items():
+            store[url] = {
+                "schema_hash": schema_hash,
+                "prompt_hash": prompt_hash,
+                "payload": payload,
+                "ts": ts,
+            }
+        self._write_store(store)
@@ -1,12 +1,11 @@
-import json
 import os
 from typing import Dict, Any, Optional
 from pathlib import Path
-from hashlib import sha256
 
 from dotenv import load_dotenv
 
 from agents.fact_finder.schemas.fact_finder_schema import FactFinderResult
+from memory.store_utils import read_json_store, statement_key, write_json_store
 
 load_dotenv()
 
@@ -28,28 +27,25 @@ class LocalFactFinderMemory:
             self._write_store({})
 
     def _read_store(self) -> Dict[str, Any]:
-        if not self.path.exists():
-            return {}
-        with self.path.open("r", encoding="utf-8") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {}
+        return read_json_store(self.path)
 
     def _write_store(self, data: Dict[str, Any]) -> None:
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json_store(self.path, data)
 
     @staticmethod
     def _key_for_statement(statement: str) -> str:
         """Create a stable key for a given statement."""
-        return sha256(statement.strip().encode("utf-8")).hexdigest()
+        return statement_key(statement)
 
     def save_result(self, result: FactFinderResult) -> str:
         """Save a FactFinderResult, return the generated key."""
+        return self.save_result_dict(result.statement, result.model_dump())
+
+    def save_result_dict(self, statement: str, result_dict: Dict[str, Any]) -> str:
+        """Save an already-dumped FactFinderResult, return the generated key."""
         store = self._read_store()
-        key = self._key_for_statement(result.statement)
-        store[key] = result.model_dump()
+        key = self._key_for_statement(statement)
+        store[key] = result_dict
         self._write_store(store)
         return key
 
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import hashlib
-import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import ValidationError
 
 from agents.pattern_analyzer.schemas.pattern_analyzer_schema import PatternAnalysisResult
+from memory.store_utils import read_json_store, statement_key, write_json_store
 
 
 DEFAULT_PATTERN_ANALYSIS_MEMORY_PATH = Path("memory/pattern_analysis_store.json")
@@ -28,27 +27,34 @@ class PatternAnalysisMemory:
             self._write_store({})
 
     def _read_store(self) -> dict:
-        if not self.path.exists():
-            return {}
-        try:
-            with self.path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            # Corrupted file; reset
-            return {}
+        return read_json_store(self.path)
 
     def _write_store(self, data: dict) -> None:
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json_store(self.path, data)
 
     @staticmethod
     def _statement_key(statement: str) -> str:
-        return hashlib.sha256(statement.strip().encode("utf-8")).hexdigest()
+        return statement_key(statement)
 
     def save_result(self, result: PatternAnalysisResult) -> None:
+        self.save_result_dict(result.statement, result.model_dump())
+
+    def save_result_dict(self, statement: str, result_dict: Dict[str, Any]) -> None:
+        """Save an already-dumped PatternAnalysisResult."""
+        store = self._read_store()
+        key = self._statement_key(statement)
+        store[key] = result_dict
+        self._write_store(store)
+
+    def append_articles(self, statement: str, article_dicts: List[Dict[str, Any]]) -> None:
+        """
+        Append already-dumped ArticleAnalysis dicts to the statement's entry,
+        creating it if needed. Used to persist partial results batch by batch.
+        """
         store = self._read_store()
-        key = self._statement_key(result.statement)
-        store[key] = result.model_dump()
+        key = self._statement_key(statement)
+        entry = store.setdefault(key, {"statement": statement, "analyzed_articles": []})
+        entry.setdefault("analyzed_articles", []).extend(article_dicts)
         self._write_store(store)
 
     def get_result_by_statement(self, statement: str) -> Optional[PatternAnalysisResult]:
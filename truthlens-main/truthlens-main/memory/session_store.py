@@ -17,6 +17,7 @@ class SessionState:
     # Keyed by normalized statement string
     fact_finder_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     pattern_analysis_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    critic_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 # Global singleton for this process
@@ -27,6 +28,19 @@ def _normalize_statement(statement: str) -> str:
     return statement.strip()
 
 
+def _put_latest(results: Dict[str, Dict[str, Any]], key: str, result_dict: Dict[str, Any]) -> None:
+    """Insert (or re-insert) so `key` becomes the last, i.e. latest, entry."""
+    results.pop(key, None)
+    results[key] = result_dict
+
+
+def _get_latest(results: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not results:
+        return None
+    last_key = next(reversed(results))
+    return results[last_key]
+
+
 # ---------- Fact-Finder session memory ----------
 
 def save_fact_finder_result_session(result_dict: Dict[str, Any]) -> None:
@@ -41,7 +55,7 @@ def save_fact_finder_result_session(result_dict: Dict[str, Any]) -> None:
     """
     statement = result_dict.get("statement", "")
     key = _normalize_statement(statement)
-    _SESSION_STATE.fact_finder_results[key] = result_dict
+    _put_latest(_SESSION_STATE.fact_finder_results, key, result_dict)
 
 
 def get_fact_finder_result_session(statement: str) -> Optional[Dict[str, Any]]:
@@ -56,10 +70,7 @@ def get_latest_fact_finder_result_session() -> Optional[Dict[str, Any]]:
     """
     Get the most recently saved FactFinderResult dict, if any.
     """
-    if not _SESSION_STATE.fact_finder_results:
-        return None
-    last_key = next(reversed(_SESSION_STATE.fact_finder_results))
-    return _SESSION_STATE.fact_finder_results[last_key]
+    return _get_latest(_SESSION_STATE.fact_finder_results)
 
 
 # ---------- Pattern Analyzer session memory ----------
@@ -76,9 +87,34 @@ def save_pattern_analysis_result_session(result_dict: Dict[str, Any]) -> None:
     """
     statement = result_dict.get("statement", "")
     key = _normalize_statement(statement)
-    _SESSION_STATE.pattern_analysis_results[key] = result_dict
+    _put_latest(_SESSION_STATE.pattern_analysis_results, key, result_dict)
 
 
 def get_pattern_analysis_result_session(statement: str) -> Optional[Dict[str, Any]]:
     key = _normalize_statement(statement)
-    return _SESSION_STATE.pattern_analysis_results.get(key)
\ No newline at end of file
+    return _SESSION_STATE.pattern_analysis_results.get(key)
+
+
+def get_latest_pattern_analysis_result_session() -> Optional[Dict[str, Any]]:
+    """
+    Get the most recently saved PatternAnalysisResult dict, if any.
+    """
+    return _get_latest(_SESSION_STATE.pattern_analysis_results)
+
+
+# ---------- Critic session memory ----------
+
+def save_critic_result_session(result_dict: Dict[str, Any]) -> None:
+    """
+    Save a CriticResult as a dict in session memory keyed by its normalized statement.
+    """
+    statement = result_dict.get("statement", "")
+    key = _normalize_statement(statement)
+    _put_latest(_SESSION_STATE.critic_results, key, result_dict)
+
+
+def get_latest_critic_result_session() -> Optional[Dict[str, Any]]:
+    """
+    Get the most recently saved CriticResult dict, if any.
+    """
+    return _get_latest(_SESSION_STATE.critic_results)
@@ -0,0 +1,130 @@
+"""Shared JSON file I/O for the local memory stores."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+# Last parse of each store file, keyed by absolute path and validated against
+# the file's (st_mtime_ns, st_size). Shared by every store instance, since the
+# tools create a fresh store object on each call.
+_STORE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_STORE_CACHE_LOCK = threading.Lock()
+
+# Files above this size are parsed straight from an mmap instead of being
+# read into a bytes object first.
+MMAP_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=1024)
+def statement_key(statement: str) -> str:
+    """Stable store key for a statement (sha256 of the stripped text)."""
+    return hashlib.sha256(statement.strip().encode("utf-8")).hexdigest()
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_json_file(path: str | Path) -> Dict[str, Any]:
+    """
+    Parse the JSON file at `path` with orjson. Large stores are mapped into
+    memory and parsed in place, small ones take the plain read path.
+    An empty or corrupted file reads as an empty store.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        try:
+            if size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            return orjson.loads(f.read()) if size else {}
+        except orjson.JSONDecodeError:
+            # Corrupted file; treat as empty
+            return {}
+
+
+def read_json_store(path: str | Path) -> Dict[str, Any]:
+    """
+    Return the parsed JSON store at `path`, reusing the previous parse while
+    the file is unchanged on disk.
+
+    The returned dict is shared with other readers: callers that modify it
+    must persist it with `write_json_store`.
+    """
+    key = os.path.abspath(path)
+    signature = _stat_signature(key)
+    if signature is None:
+        return {}
+
+    with _STORE_CACHE_LOCK:
+        cached = _STORE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        data = load_json_file(key)
+    except FileNotFoundError:
+        # Removed between the stat and the open
+        return {}
+
+    with _STORE_CACHE_LOCK:
+        _STORE_CACHE[key] = (signature, data)
+    return data
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    """
+    Write to a sibling temp file and rename it over `path`, so a crash
+    mid-write never leaves a truncated store behind (which would read back
+    as an empty store, i.e. "no prior run").
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+def write_json_store(path: str | Path, data: Dict[str, Any], indent: bool = True) -> None:
+    """
+    Write `data` to the JSON store at `path` and prime the read cache.
+
+    Stores meant for humans to browse stay indented; pass indent=False for
+    machine-only stores.
+    """
+    key = os.path.abspath(path)
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    _atomic_write(key, orjson.dumps(data, option=option))
+
+    signature = _stat_signature(key)
+    with _STORE_CACHE_LOCK:
+        if signature is None:
+            _STORE_CACHE.pop(key, None)
+        else:
+            _STORE_CACHE[key] = (signature, data)
+
+
+def write_json_store_bytes(path: str | Path, payload: bytes) -> None:
+    """
+    Write already-serialised JSON to the store at `path`. The read cache is
+    dropped for that path and refilled by the next `read_json_store`.
+    """
+    key = os.path.abspath(path)
+    _atomic_write(key, payload)
+
+    with _STORE_CACHE_LOCK:
+        _STORE_CACHE.pop(key, None)